@@ -17,12 +17,14 @@ Features:
 """
 
 import streamlit as st
-import tempfile
+import io
 import os
+import re
 import shutil
 from datetime import datetime
 import base64
 from PIL import Image
+import numpy as np
 import pandas as pd
 import sys
 
@@ -86,15 +88,13 @@ def main():
         )
         
         if custom_input.strip():
-            try:
-                points = []
-                pairs = custom_input.strip().split()
-                for pair in pairs:
-                    x, y = map(int, pair.split(','))
-                    points.append((x, y))
-                custom_points = points[:8]  # Limit to 8 points
+            # Single C-level regex pass over the whole input instead of
+            # per-token split + map(int) with exception handling
+            pairs = re.findall(r'(-?\d+),(-?\d+)', custom_input)
+            if pairs and len(pairs) == len(custom_input.split()):
+                custom_points = [(int(x), int(y)) for x, y in pairs][:8]  # Limit to 8 points
                 st.sidebar.success(f"✅ {len(custom_points)} custom points loaded")
-            except:
+            else:
                 st.sidebar.error("❌ Invalid format. Use: x,y x,y x,y...")
     
     # Main content area
@@ -111,8 +111,9 @@ def main():
         )
         
         if ref_file:
-            ref_image = Image.open(ref_file)
-            st.image(ref_image, caption=f"Reference: {ref_file.name}", use_container_width=True)
+            # Hand the raw bytes to Streamlit - avoids a full PIL decode
+            # just to render a downscaled preview
+            st.image(ref_file.getvalue(), caption=f"Reference: {ref_file.name}", use_container_width=True)
     
     with col2:
         st.subheader("🔬 Test Image")
@@ -124,8 +125,7 @@ def main():
         )
         
         if test_file:
-            test_image = Image.open(test_file)
-            st.image(test_image, caption=f"Test: {test_file.name}", use_container_width=True)
+            st.image(test_file.getvalue(), caption=f"Test: {test_file.name}", use_container_width=True)
     
     # Analysis section
     st.markdown("---")
@@ -162,75 +162,109 @@ def main():
         """)
 
 
+@st.cache_resource(max_entries=4)
+def _load_checker(ref_bytes, test_bytes):
+    """
+    Build an analyzer for a pair of uploaded images and decode them once.
+
+    The uploaded bytes are decoded straight from memory - no temp files -
+    and cache_resource keeps the checker (including its decoded image
+    arrays) alive across Streamlit reruns, so tweaking the threshold or
+    method doesn't pay for another JPEG decode of the same uploads.
+    """
+    ref_image = Image.open(io.BytesIO(ref_bytes)).convert('RGB')
+    test_image = Image.open(io.BytesIO(test_bytes)).convert('RGB')
+    return ImageComparisonTool.from_images(ref_image, test_image,
+                                           reference_name="reference.jpg",
+                                           test_name="test.jpg")
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _run_cached(ref_bytes, test_bytes, method, threshold, num_points, custom_points):
+    """
+    Run the full analysis once per unique (images, parameters) combination.
+
+    Streamlit hashes the raw image bytes and parameters, so re-clicking
+    "Run Analysis" with unchanged inputs returns instantly from cache
+    instead of re-running the whole pipeline.
+    """
+    checker = _load_checker(ref_bytes, test_bytes)
+    checker.set_significance_threshold(threshold)
+
+    output_paths = checker.run_full_analysis(
+        num_points=num_points,
+        method=method,
+        custom_points=list(custom_points) if custom_points else None,
+        save_visualization=True,
+        save_report=True
+    )
+
+    # Package everything display_results needs as plain serializable data
+    flags = checker.results['is_significant']
+    total_points = len(flags)
+    significant_count = int(flags.sum())
+    pass_rate = ((total_points - significant_count) / total_points) * 100 if total_points else 0.0
+    grade, description = checker._calculate_quality_grade(pass_rate)
+
+    return {
+        'comparison_results': checker.comparison_results,
+        'results': checker.results,
+        'total_points': total_points,
+        'significant_count': significant_count,
+        'pass_rate': pass_rate,
+        'grade': grade,
+        'description': description,
+        'viz_path': output_paths['viz'],
+        'report_path': output_paths['report'],
+    }
+
+
 def run_analysis(ref_file, test_file, method, threshold, num_points, custom_points):
-    """Run the image comparison analysis"""
-    
+    """Run the image comparison analysis (memoized across reruns)"""
+
     progress_bar = st.progress(0)
     status_text = st.empty()
-    
+
     try:
-        # Create temporary files
-        status_text.text("📁 Preparing files...")
-        progress_bar.progress(10)
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Save uploaded files
-            ref_path = os.path.join(temp_dir, "reference.jpg")
-            test_path = os.path.join(temp_dir, "test.jpg")
-            
-            with open(ref_path, "wb") as f:
-                f.write(ref_file.getbuffer())
-            with open(test_path, "wb") as f:
-                f.write(test_file.getbuffer())
-            
-            progress_bar.progress(30)
-            
-            # Initialize analyzer
-            status_text.text("🔧 Initializing analyzer...")
-            checker = ImageComparisonTool(ref_path, test_path)
-            checker.set_significance_threshold(threshold)
-            
-            progress_bar.progress(50)
-            
-            # Run analysis
-            status_text.text("🔍 Analyzing images...")
-            checker.run_full_analysis(
-                num_points=num_points,
-                method=method,
-                custom_points=custom_points,
-                save_visualization=True,
-                save_report=True
-            )
-            
-            progress_bar.progress(80)
-            
-            # Display results
-            status_text.text("📊 Displaying results...")
-            display_results(checker)
-            
-            progress_bar.progress(100)
-            status_text.text("✅ Analysis complete!")
-            
+        status_text.text("🔍 Analyzing images...")
+        progress_bar.progress(20)
+
+        analysis = _run_cached(
+            ref_file.getvalue(),
+            test_file.getvalue(),
+            method,
+            threshold,
+            int(num_points),
+            tuple(custom_points) if custom_points else None
+        )
+
+        progress_bar.progress(80)
+
+        # Display results
+        status_text.text("📊 Displaying results...")
+        display_results(analysis)
+
+        progress_bar.progress(100)
+        status_text.text("✅ Analysis complete!")
+
     except Exception as e:
         st.error(f"❌ Analysis failed: {str(e)}")
         st.error("Please check your images and try again.")
 
 
-def display_results(checker):
-    """Display analysis results"""
-    
-    if not checker.comparison_results:
+def display_results(analysis):
+    """Display analysis results from the cached analysis payload"""
+
+    if not analysis['comparison_results']:
         st.error("No results to display")
         return
-    
-    # Calculate summary statistics
-    significant_count = sum(1 for r in checker.comparison_results if r['is_significant'])
-    total_points = len(checker.comparison_results)
-    pass_rate = ((total_points - significant_count) / total_points) * 100
-    
-    # Get quality grade
-    grade, description = checker._calculate_quality_grade(pass_rate)
-    
+
+    total_points = analysis['total_points']
+    significant_count = analysis['significant_count']
+    pass_rate = analysis['pass_rate']
+    grade = analysis['grade']
+    description = analysis['description']
+
     # Display summary
     st.subheader("📈 Analysis Results")
     
@@ -250,19 +284,28 @@ def display_results(checker):
     # Results table
     st.subheader("📋 Detailed Results")
     
-    # Create DataFrame for better display
-    df_data = []
-    for result in checker.comparison_results:
-        df_data.append({
-            "Point": f"P{result['point_id']}",
-            "Location (X,Y)": f"({result['coordinates'][0]}, {result['coordinates'][1]})",
-            "Reference RGB": str(result['reference_rgb']),
-            "Test RGB": str(result['test_rgb']),
-            "Difference": f"{result['total_difference']:.1f}",
-            "Status": "❌ FAIL" if result['is_significant'] else "✅ PASS"
-        })
-    
-    df = pd.DataFrame(df_data)
+    # Build the table from the columnar result arrays in one vectorized
+    # formatting pass instead of per-row Python f-strings
+    results = analysis['results']
+    coords = results['coordinates']
+    flags = results['is_significant']
+
+    def rgb_strings(rgb):
+        r, g, b = (pd.Series(rgb[:, i]).astype(str) for i in range(3))
+        return '(' + r + ', ' + g + ', ' + b + ')'
+
+    point_ids = pd.Series(np.arange(1, total_points + 1)).astype(str)
+    xs = pd.Series(coords[:, 0]).astype(str)
+    ys = pd.Series(coords[:, 1]).astype(str)
+
+    df = pd.DataFrame({
+        "Point": 'P' + point_ids,
+        "Location (X,Y)": '(' + xs + ', ' + ys + ')',
+        "Reference RGB": rgb_strings(results['reference_rgb']),
+        "Test RGB": rgb_strings(results['test_rgb']),
+        "Difference": np.char.mod('%.1f', results['total_difference']),
+        "Status": np.where(flags, "❌ FAIL", "✅ PASS")
+    })
     st.dataframe(df, use_container_width=True)
     
     # Quality assessment
@@ -271,41 +314,33 @@ def display_results(checker):
     st.markdown(f"**{grade_emoji.get(grade, '🏆')} Overall Result: {grade}**")
     st.info(description)
     
-    # Find and display visualization
-    reports_dir = "reports"
-    if os.path.exists(reports_dir):
-        # Find the latest report directory
-        subdirs = [d for d in os.listdir(reports_dir) if os.path.isdir(os.path.join(reports_dir, d))]
-        if subdirs:
-            latest_dir = max(subdirs)
-            viz_files = [f for f in os.listdir(os.path.join(reports_dir, latest_dir)) if f.endswith('.png')]
-            
-            if viz_files:
-                viz_path = os.path.join(reports_dir, latest_dir, viz_files[0])
-                st.subheader("📊 Visual Analysis")
-                st.image(viz_path, caption="Detailed Comparison Chart", use_container_width=True)
-                
-                # Download button for visualization
-                with open(viz_path, "rb") as file:
-                    btn = st.download_button(
-                        label="📥 Download Visualization",
-                        data=file.read(),
-                        file_name=f"comparison_chart_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png",
-                        mime="image/png"
-                    )
-            
-            # Download button for text report
-            txt_files = [f for f in os.listdir(os.path.join(reports_dir, latest_dir)) if f.endswith('.txt')]
-            if txt_files:
-                txt_path = os.path.join(reports_dir, latest_dir, txt_files[0])
-                with open(txt_path, "r", encoding="utf-8") as file:
-                    report_content = file.read()
-                    st.download_button(
-                        label="📥 Download Text Report",
-                        data=report_content,
-                        file_name=f"comparison_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-                        mime="text/plain"
-                    )
+    # Display the visualization and report using the exact paths the
+    # analyzer reported - no reports/ directory scanning needed
+    viz_path = analysis['viz_path']
+    if viz_path and os.path.exists(viz_path):
+        st.subheader("📊 Visual Analysis")
+        st.image(viz_path, caption="Detailed Comparison Chart", use_container_width=True)
+
+        # Download button for visualization
+        with open(viz_path, "rb") as file:
+            btn = st.download_button(
+                label="📥 Download Visualization",
+                data=file.read(),
+                file_name=f"comparison_chart_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png",
+                mime="image/png"
+            )
+
+    # Download button for text report
+    report_path = analysis['report_path']
+    if report_path and os.path.exists(report_path):
+        with open(report_path, "r", encoding="utf-8") as file:
+            report_content = file.read()
+            st.download_button(
+                label="📥 Download Text Report",
+                data=report_content,
+                file_name=f"comparison_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                mime="text/plain"
+            )
 
 
 if __name__ == "__main__":
@@ -1,14 +1,20 @@
+import bisect
 import cv2
+import functools
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import pandas as pd
 from datetime import datetime
 import os
-import random
 from typing import List, Tuple, Dict, Any
 
+# Numba is optional - when available, large point batches run through a
+# JIT-compiled kernel with no (N,3) temporaries; otherwise the NumPy
+# vectorized path below is used
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
 # Configuration Constants
 DEFAULT_SIGNIFICANCE_THRESHOLD = 30.0  # RGB Euclidean distance threshold for significant defects
 
@@ -25,12 +31,118 @@ GRADE_GOOD = "GOOD"
 GRADE_ACCEPTABLE = "ACCEPTABLE"
 GRADE_FAIL = "FAIL"
 
+# Grade lookup table for _calculate_quality_grade - thresholds are
+# ascending and inclusive, so bisect_right(pass_rate) indexes straight
+# into the matching (grade, description) band
+_GRADE_THRESHOLDS = (ACCEPTABLE_THRESHOLD, GOOD_THRESHOLD, EXCELLENT_THRESHOLD)
+_GRADES = (
+    (GRADE_FAIL, "Significant pixel defects detected. Image quality is below acceptable standards."),
+    (GRADE_ACCEPTABLE, "Some pixel defects detected but still within acceptable range. Consider monitoring."),
+    (GRADE_GOOD, "Minor pixel defects detected but within acceptable limits. Image quality is good."),
+    (GRADE_EXCELLENT, "No significant pixel defects detected. Image is suitable for production use."),
+)
+
+# Per-point report block template - one %-format per point instead of
+# seven f-strings, with the newlines baked in
+_POINT_REPORT_TPL = (
+    "Test Point %d:\n"
+    "  Location (X,Y): (%d, %d)\n"
+    "  Reference RGB: %s\n"
+    "  Test RGB: %s\n"
+    "  RGB Differences (R,G,B): %s\n"
+    "  Total Difference: %.2f\n"
+    "  Status: %s\n"
+)
+
+
+# JIT'd batches below this size aren't worth the dispatch overhead
+_NUMBA_MIN_POINTS = 64
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _sig_kernel(ref, tst, xs, ys, thr_sq):
+        """Per-point squared distance vs threshold, zero temporaries"""
+        n = xs.shape[0]
+        significant = np.empty(n, np.bool_)
+        total = np.empty(n, np.float32)
+        for i in prange(n):
+            x = xs[i]
+            y = ys[i]
+            d0 = np.int32(tst[y, x, 0]) - np.int32(ref[y, x, 0])
+            d1 = np.int32(tst[y, x, 1]) - np.int32(ref[y, x, 1])
+            d2 = np.int32(tst[y, x, 2]) - np.int32(ref[y, x, 2])
+            sq = d0 * d0 + d1 * d1 + d2 * d2
+            significant[i] = sq > thr_sq
+            total[i] = np.sqrt(np.float32(sq))
+        return significant, total
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(path: str):
+    """
+    Decode an image file to a BGR array, caching the last few decodes
+
+    Batch pipelines compare one reference against many test images; the
+    cache means every checker sharing a path pays for a single JPEG
+    decode. np.fromfile + cv2.imdecode reads through the OS page cache,
+    so even a cache miss after a restart skips the cold disk read.
+
+    The returned array is shared between instances and must be treated
+    as read-only (the comparison pipeline never writes to it).
+    """
+    data = np.fromfile(path, dtype=np.uint8)
+    return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+
+class _ComparisonResultsView:
+    """
+    List-like, lazily materialized view over the columnar result arrays
+
+    Keeps the historical list-of-dicts API of comparison_results while
+    the data itself lives in contiguous NumPy columns (see
+    ImageComparisonTool.results). A per-point dict is only built when a
+    row is actually indexed or iterated.
+    """
+
+    def __init__(self, results: Dict[str, Any], point_ids):
+        self._results = results
+        self._point_ids = point_ids
+
+    def __len__(self):
+        return len(self._point_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        r = self._results
+        x, y = r['coordinates'][index]
+        ref_px = r['reference_rgb'][index]
+        test_px = r['test_rgb'][index]
+        return {
+            'point_id': int(self._point_ids[index]),
+            'coordinates': (int(x), int(y)),
+            'reference_rgb': tuple(ref_px.tolist()),
+            'test_rgb': tuple(test_px.tolist()),
+            'rgb_difference': tuple((test_px.astype(np.int16) - ref_px.astype(np.int16)).tolist()),
+            'total_difference': float(r['total_difference'][index]),
+            'is_significant': bool(r['is_significant'][index]),
+        }
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
 
 class ImageComparisonTool:
     """
     Class for checking and comparing images for visual defects and differences
     """
-    
+
+    # Figure/axes reused by visualize_comparison across all instances -
+    # allocated lazily on first render, released via close_figure()
+    _fig = None
+    _axes = None
+
     def __init__(self, reference_image_path: str, test_image_path: str):
         """
         Initialize the VideoImageChecker
@@ -45,8 +157,79 @@ class ImageComparisonTool:
         self.test_image = None
         self.test_points = []
         self.comparison_results = []
+        self.results = {}  # Columnar (struct-of-arrays) view of comparison results
+        self.output_paths = {'viz': None, 'report': None}  # Last saved output files
         self.significance_threshold = DEFAULT_SIGNIFICANCE_THRESHOLD  # Configurable threshold
+        self._rng = np.random.default_rng()  # Cached generator for point sampling
+        self._images_identical = None  # Lazily computed memcmp result (see compare_pixels)
         
+    @classmethod
+    def from_images(cls, reference_image, test_image,
+                    reference_name: str = 'reference', test_name: str = 'test'):
+        """
+        Build a checker from already-loaded PIL Images (no file roundtrip)
+
+        Args:
+            reference_image: PIL Image of the reference (good) image
+            test_image: PIL Image of the test image
+            reference_name: Label used in reports in place of a file path
+            test_name: Label used in reports in place of a file path
+
+        Returns:
+            ImageComparisonTool with both images already loaded
+        """
+        checker = cls(reference_name, test_name)
+        # Internal arrays follow OpenCV's BGR channel order
+        checker.reference_image = np.asarray(reference_image.convert('RGB'))[:, :, ::-1]
+        checker.test_image = np.asarray(test_image.convert('RGB'))[:, :, ::-1]
+        return checker
+
+    @classmethod
+    def from_arrays(cls, reference_array, test_array,
+                    reference_name: str = 'reference', test_name: str = 'test'):
+        """
+        Build a checker from (H,W,3) uint8 RGB arrays already in memory
+
+        Callers that just produced the images (e.g. sample generators)
+        can skip the JPEG encode-then-decode roundtrip entirely.
+
+        Args:
+            reference_array: RGB array of the reference (good) image
+            test_array: RGB array of the test image
+            reference_name: Label used in reports in place of a file path
+            test_name: Label used in reports in place of a file path
+
+        Returns:
+            ImageComparisonTool with both images already loaded
+        """
+        checker = cls(reference_name, test_name)
+        # Internal arrays follow OpenCV's BGR channel order
+        checker.reference_image = np.asarray(reference_array)[:, :, ::-1]
+        checker.test_image = np.asarray(test_array)[:, :, ::-1]
+        return checker
+
+    @property
+    def reference_image_rgb(self):
+        """
+        Reference image as an RGB view (internal storage is BGR)
+
+        A reversed-channel stride view - no copy is made.
+        """
+        if self.reference_image is None:
+            return None
+        return self.reference_image[..., ::-1]
+
+    @property
+    def test_image_rgb(self):
+        """
+        Test image as an RGB view (internal storage is BGR)
+
+        A reversed-channel stride view - no copy is made.
+        """
+        if self.test_image is None:
+            return None
+        return self.test_image[..., ::-1]
+
     def set_significance_threshold(self, threshold: float):
         """
         Set the significance threshold for defect detection
@@ -75,19 +258,25 @@ class ImageComparisonTool:
         Returns:
             bool: True if successful, False otherwise
         """
+        # Already decoded (e.g. run_full_analysis called repeatedly on the
+        # same instance with different methods) - reuse the loaded arrays
+        # instead of re-reading and re-decoding the files
+        if self.reference_image is not None and self.test_image is not None:
+            return True
+
         try:
-            # Load images in color format
-            self.reference_image = cv2.imread(self.reference_image_path, cv2.IMREAD_COLOR)
-            self.test_image = cv2.imread(self.test_image_path, cv2.IMREAD_COLOR)
+            # Load images in color format through the shared decode cache
+            self.reference_image = _load_cached(self.reference_image_path)
+            self.test_image = _load_cached(self.test_image_path)
             
             if self.reference_image is None or self.test_image is None:
                 print("Error: Cannot load images - check file paths")
                 return False
-                
-            # Convert BGR to RGB for proper matplotlib display
-            self.reference_image = cv2.cvtColor(self.reference_image, cv2.COLOR_BGR2RGB)
-            self.test_image = cv2.cvtColor(self.test_image, cv2.COLOR_BGR2RGB)
-            
+
+            # Images stay in OpenCV's native BGR order - the distance math
+            # is channel-symmetric, and display/report code flips the
+            # channel axis with a free [..., ::-1] view instead of paying
+            # for a full-image cvtColor copy per load
             print(f"Reference image loaded: {self.reference_image.shape}")
             print(f"Test image loaded: {self.test_image.shape}")
             
@@ -134,34 +323,32 @@ class ImageComparisonTool:
         points = []
         
         if method == 'custom' and custom_points:
-            # Use user-provided custom points
-            valid_points = []
-            for x, y in custom_points:
-                if 0 <= x < width and 0 <= y < height:
-                    valid_points.append((x, y))
-                else:
-                    print(f"Warning: Point ({x},{y}) is outside image bounds ({width}x{height}), skipping")
-            points = valid_points
+            # Use user-provided custom points, filtered with a single
+            # vectorized bounds mask and one summary warning
+            arr = np.asarray(custom_points, dtype=np.int32).reshape(-1, 2)
+            mask = ((arr[:, 0] >= 0) & (arr[:, 0] < width) &
+                    (arr[:, 1] >= 0) & (arr[:, 1] < height))
+            dropped = int((~mask).sum())
+            if dropped:
+                print(f"Warning: dropped {dropped} point(s) outside image bounds ({width}x{height})")
+            points = [tuple(p) for p in arr[mask].tolist()]
             
         elif method == 'random':
-            # Generate random points with margin from edges
-            for _ in range(num_points):
-                x = random.randint(10, width - 10)
-                y = random.randint(10, height - 10)
-                points.append((x, y))
-                
+            # Generate all random points (with margin from edges) in a
+            # single vectorized draw instead of per-point randint calls
+            xs = self._rng.integers(10, width - 10, size=num_points, endpoint=True)
+            ys = self._rng.integers(10, height - 10, size=num_points, endpoint=True)
+            points = list(zip(xs.tolist(), ys.tolist()))
+
         elif method == 'grid':
-            # Generate points in a uniform grid pattern
+            # Generate points in a uniform grid pattern via meshgrid
             cols = int(np.sqrt(num_points))
             rows = int(np.ceil(num_points / cols))
-            
-            for i in range(rows):
-                for j in range(cols):
-                    if len(points) >= num_points:
-                        break
-                    x = int((j + 1) * width / (cols + 1))
-                    y = int((i + 1) * height / (rows + 1))
-                    points.append((x, y))
+
+            grid_x = (np.arange(1, cols + 1) * width) // (cols + 1)
+            grid_y = (np.arange(1, rows + 1) * height) // (rows + 1)
+            xx, yy = np.meshgrid(grid_x, grid_y)
+            points = list(zip(xx.ravel().tolist(), yy.ravel().tolist()))[:num_points]
                     
         elif method == 'strategic':
             # Test corners and strategic central points
@@ -197,48 +384,80 @@ class ImageComparisonTool:
             print("Error: Images not loaded")
             return []
             
-        results = []
-        
+        # Bind the images to locals once - every later use is a LOAD_FAST
+        # instead of repeated attribute lookups
+        ref = self.reference_image
+        tst = self.test_image
+
         # Get image dimensions for safety checks
-        ref_height, ref_width = self.reference_image.shape[:2]
-        test_height, test_width = self.test_image.shape[:2]
-        
-        for i, (x, y) in enumerate(self.test_points):
-            # Safety check: ensure coordinates are valid for both images
-            if (x >= ref_width or y >= ref_height or 
-                x >= test_width or y >= test_height or 
-                x < 0 or y < 0):
+        ref_height, ref_width = ref.shape[:2]
+        test_height, test_width = tst.shape[:2]
+        height = min(ref_height, test_height)
+        width = min(ref_width, test_width)
+
+        # Safety check: keep only coordinates valid for both images
+        pts = np.asarray(self.test_points, dtype=np.intp)
+        valid = ((pts[:, 0] >= 0) & (pts[:, 0] < width) &
+                 (pts[:, 1] >= 0) & (pts[:, 1] < height))
+        if not valid.all():
+            for i in np.flatnonzero(~valid):
+                x, y = pts[i]
                 print(f"⚠️ Skipping invalid point {i+1}: ({x},{y}) - outside image bounds")
-                continue
-                
-            # Extract RGB values at test point
-            ref_pixel = self.reference_image[y, x]
-            test_pixel = self.test_image[y, x]
-            
-            # Calculate per-channel differences
-            r_diff = int(test_pixel[0]) - int(ref_pixel[0])
-            g_diff = int(test_pixel[1]) - int(ref_pixel[1])
-            b_diff = int(test_pixel[2]) - int(ref_pixel[2])
-            
-            # Calculate Euclidean distance (total difference)
-            total_diff = np.sqrt(r_diff**2 + g_diff**2 + b_diff**2)
-            
-            # Create result dictionary
-            result = {
-                'point_id': i + 1,
-                'coordinates': (x, y),
-                'reference_rgb': tuple(map(int, ref_pixel)),
-                'test_rgb': tuple(map(int, test_pixel)),
-                'rgb_difference': (r_diff, g_diff, b_diff),
-                'total_difference': total_diff,
-                'is_significant': total_diff > self.significance_threshold  # Use configurable threshold
-            }
-            
-            results.append(result)
-            
-        self.comparison_results = results
-        print(f"Compared {len(results)} pixel points")
-        return results
+        point_ids = np.flatnonzero(valid) + 1
+        pts = pts[valid]
+        xs, ys = pts[:, 0], pts[:, 1]
+
+        # Gather all test-point pixels in one fancy-indexing pass
+        ref_pixels = ref[ys, xs]
+        test_pixels = tst[ys, xs]
+
+        # Byte-identical images (common in CI regression runs) mean every
+        # point passes with zero difference - one SIMD-vectorized memcmp,
+        # cached per instance, replaces all the distance math
+        if self._images_identical is None:
+            self._images_identical = (ref.shape == tst.shape
+                                      and np.array_equal(ref, tst))
+
+        # Compare squared distances against the squared threshold so the
+        # significance decision never pays for a sqrt; the root is only
+        # taken for the display/report field below
+        threshold_sq = self.significance_threshold * self.significance_threshold
+        if self._images_identical:
+            significant = np.zeros(len(pts), dtype=bool)
+            total_diff = np.zeros(len(pts), dtype=np.float32)
+        elif HAVE_NUMBA and len(pts) >= _NUMBA_MIN_POINTS:
+            # JIT'd parallel loop - no per-batch temporaries
+            significant, total_diff = _sig_kernel(
+                ref, tst, xs, ys, np.float32(threshold_sq))
+        else:
+            # NumPy vectorized path for small batches (or without numba).
+            # One bulk int16 widening per side - the narrowest dtype that
+            # holds -255..255 - instead of per-scalar int() conversions
+            diff = (test_pixels.astype(np.int16, copy=False)
+                    - ref_pixels.astype(np.int16, copy=False))
+            sq_diff = np.einsum('ij,ij->i', diff, diff, dtype=np.int32)
+            significant = sq_diff > threshold_sq  # Use configurable threshold
+            total_diff = np.sqrt(sq_diff.astype(np.float32))
+
+        # Flip the BGR channel axis (a free view, no copy) wherever a
+        # field is labeled RGB
+        ref_rgb = ref_pixels[:, ::-1]
+        test_rgb = test_pixels[:, ::-1]
+
+        # Columnar view for vectorized downstream reductions
+        self.results = {
+            'coordinates': pts.astype(np.int32),
+            'reference_rgb': ref_rgb,
+            'test_rgb': test_rgb,
+            'total_difference': total_diff.astype(np.float32),
+            'is_significant': significant,
+        }
+
+        # The dict-per-point API stays available through a lazy view -
+        # rows are materialized only when actually indexed or iterated
+        self.comparison_results = _ComparisonResultsView(self.results, point_ids.astype(np.int32))
+        print(f"Compared {len(self.comparison_results)} pixel points")
+        return self.comparison_results
     
     def _calculate_quality_grade(self, pass_rate: float) -> tuple[str, str]:
         """
@@ -250,14 +469,8 @@ class ImageComparisonTool:
         Returns:
             tuple: (grade, description)
         """
-        if pass_rate >= EXCELLENT_THRESHOLD:
-            return GRADE_EXCELLENT, "No significant pixel defects detected. Image is suitable for production use."
-        elif pass_rate >= GOOD_THRESHOLD:
-            return GRADE_GOOD, "Minor pixel defects detected but within acceptable limits. Image quality is good."
-        elif pass_rate >= ACCEPTABLE_THRESHOLD:
-            return GRADE_ACCEPTABLE, "Some pixel defects detected but still within acceptable range. Consider monitoring."
-        else:
-            return GRADE_FAIL, "Significant pixel defects detected. Image quality is below acceptable standards."
+        # Branchless, data-driven lookup instead of an if/elif cascade
+        return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, pass_rate)]
     
     def visualize_comparison(self, save_path: str = None):
         """
@@ -273,34 +486,62 @@ class ImageComparisonTool:
         if not self.comparison_results:
             print("Error: No comparison results to visualize")
             return
-            
-        # Create 2x2 subplot layout
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+
+        # matplotlib is imported lazily - batch/headless callers that
+        # never visualize skip its import cost and memory entirely
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot as plt
+
+        # Reuse one 2x2 subplot layout across renders - pipelines that
+        # visualize many pairs pay for figure/axes construction once and
+        # just clear the axes on subsequent calls
+        cls = type(self)
+        if cls._fig is None:
+            cls._fig, cls._axes = plt.subplots(2, 2, figsize=(15, 12))
+        fig, axes = cls._fig, cls._axes
+        for ax in axes.ravel():
+            ax.clear()
         fig.suptitle('Video Image Quality Comparison Report', fontsize=16, fontweight='bold')
-        
+
+        # Downsample very large sources before handing them to imshow -
+        # the rendered figure caps out around 2000 px anyway, so Agg
+        # rasterizing a full 4K array is pure wasted bandwidth
+        ref_disp = self.reference_image_rgb
+        test_disp = self.test_image_rgb
+        scale = 1.0
+        longest = max(self.reference_image.shape[:2] + self.test_image.shape[:2])
+        if longest > 2000:
+            scale = 2000.0 / longest
+            ref_disp = cv2.resize(self.reference_image, None, fx=scale, fy=scale,
+                                  interpolation=cv2.INTER_AREA)[..., ::-1]
+            test_disp = cv2.resize(self.test_image, None, fx=scale, fy=scale,
+                                   interpolation=cv2.INTER_AREA)[..., ::-1]
+
         # Plot 1: Reference image with test points
-        axes[0, 0].imshow(self.reference_image)
+        # (BGR->RGB via a reversed-channel view - no copy)
+        axes[0, 0].imshow(ref_disp)
         axes[0, 0].set_title('Reference Image (Good Quality)', fontsize=12)
         axes[0, 0].axis('off')
-        
-        # Mark test points on reference image
+
+        # Mark test points on reference image (scaled to the display size)
         for i, (x, y) in enumerate(self.test_points):
-            axes[0, 0].plot(x, y, 'go', markersize=8)
-            axes[0, 0].annotate(f'{i+1}', (x, y), xytext=(5, 5), 
-                              textcoords='offset points', color='white', 
+            axes[0, 0].plot(x * scale, y * scale, 'go', markersize=8)
+            axes[0, 0].annotate(f'{i+1}', (x * scale, y * scale), xytext=(5, 5),
+                              textcoords='offset points', color='white',
                               fontweight='bold', fontsize=10)
-        
+
         # Plot 2: Test image with colored test points
-        axes[0, 1].imshow(self.test_image)
+        axes[0, 1].imshow(test_disp)
         axes[0, 1].set_title('Test Image (Under Analysis)', fontsize=12)
         axes[0, 1].axis('off')
-        
+
         # Mark test points with color coding (red = significant difference)
         for i, (x, y) in enumerate(self.test_points):
             color = 'ro' if self.comparison_results[i]['is_significant'] else 'go'
-            axes[0, 1].plot(x, y, color, markersize=8)
-            axes[0, 1].annotate(f'{i+1}', (x, y), xytext=(5, 5), 
-                              textcoords='offset points', color='white', 
+            axes[0, 1].plot(x * scale, y * scale, color, markersize=8)
+            axes[0, 1].annotate(f'{i+1}', (x * scale, y * scale), xytext=(5, 5),
+                              textcoords='offset points', color='white',
                               fontweight='bold', fontsize=10)
         
         # Plot 3: Bar chart of differences
@@ -384,14 +625,30 @@ class ImageComparisonTool:
                 for i in range(4):
                     table[(overall_row_index, i)].set_facecolor(color)
         
-        plt.tight_layout()
-        
+        fig.tight_layout()
+
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            # 150 DPI on a 15x12-inch figure is already 2250x1800 px -
+            # print resolution just quadruples rasterization time
+            fig.savefig(save_path, dpi=150, bbox_inches='tight')
             print(f"Visualization saved to: {save_path}")
-        
-        # Close the figure to free memory
-        plt.close()
+
+        # The figure stays alive for the next render - call close_figure()
+        # at shutdown to release it
+
+    @classmethod
+    def close_figure(cls):
+        """
+        Release the figure kept alive for reuse by visualize_comparison
+
+        Call once at shutdown (or whenever no more visualizations are
+        expected) to return the matplotlib memory.
+        """
+        if cls._fig is not None:
+            import matplotlib.pyplot as plt
+            plt.close(cls._fig)
+            cls._fig = None
+            cls._axes = None
     
     def generate_report(self, output_path: str = None) -> str:
         """
@@ -405,95 +662,101 @@ class ImageComparisonTool:
         """
         if not self.comparison_results:
             return "No comparison results available"
-            
-        report_lines = []
-        report_lines.append("=" * 80)
-        report_lines.append("VIDEO IMAGE QUALITY COMPARISON REPORT")
-        report_lines.append("=" * 80)
-        report_lines.append(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append(f"Reference Image: {os.path.basename(self.reference_image_path)}")
-        report_lines.append(f"Test Image: {os.path.basename(self.test_image_path)}")
-        report_lines.append("")
-        
+
+        # Accumulate UTF-8 bytes in one growable buffer - a single pass
+        # over the data and a single binary write, instead of
+        # list -> join -> encode through the text file layer
+        buf = bytearray()
+
+        def emit(line=""):
+            buf.extend(line.encode('utf-8'))
+            buf.extend(b"\n")
+
+        emit("=" * 80)
+        emit("VIDEO IMAGE QUALITY COMPARISON REPORT")
+        emit("=" * 80)
+        emit(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        emit(f"Reference Image: {os.path.basename(self.reference_image_path)}")
+        emit(f"Test Image: {os.path.basename(self.test_image_path)}")
+        emit()
+
         # Executive Summary
-        significant_failures = sum(1 for result in self.comparison_results 
+        significant_failures = sum(1 for result in self.comparison_results
                                  if result['is_significant'])
         total_points = len(self.comparison_results)
         pass_rate = ((total_points - significant_failures) / total_points) * 100
-        
-        report_lines.append("EXECUTIVE SUMMARY:")
-        report_lines.append("-" * 40)
-        report_lines.append(f"Total test points: {total_points}")
-        report_lines.append(f"Points with significant defects: {significant_failures}")
-        report_lines.append(f"Points passed: {total_points - significant_failures}")
-        report_lines.append(f"Pass rate: {pass_rate:.1f}%")
-        
+
+        emit("EXECUTIVE SUMMARY:")
+        emit("-" * 40)
+        emit(f"Total test points: {total_points}")
+        emit(f"Points with significant defects: {significant_failures}")
+        emit(f"Points passed: {total_points - significant_failures}")
+        emit(f"Pass rate: {pass_rate:.1f}%")
+
         # Calculate quality grade
         grade, description = self._calculate_quality_grade(pass_rate)
-        report_lines.append(f"Overall result: {grade}")
-        report_lines.append("")
-        
+        emit(f"Overall result: {grade}")
+        emit()
+
         # Detailed Results
-        report_lines.append("DETAILED PIXEL ANALYSIS:")
-        report_lines.append("-" * 80)
-        
+        emit("DETAILED PIXEL ANALYSIS:")
+        emit("-" * 80)
+
         for result in self.comparison_results:
             status = "FAIL (Significant defect)" if result['is_significant'] else "PASS"
-            report_lines.append(f"Test Point {result['point_id']}:")
-            report_lines.append(f"  Location (X,Y): ({result['coordinates'][0]}, {result['coordinates'][1]})")
-            report_lines.append(f"  Reference RGB: {result['reference_rgb']}")
-            report_lines.append(f"  Test RGB: {result['test_rgb']}")
-            report_lines.append(f"  RGB Differences (R,G,B): {result['rgb_difference']}")
-            report_lines.append(f"  Total Difference: {result['total_difference']:.2f}")
-            report_lines.append(f"  Status: {status}")
-            report_lines.append("")
-        
+            emit(_POINT_REPORT_TPL % (
+                result['point_id'],
+                result['coordinates'][0], result['coordinates'][1],
+                result['reference_rgb'],
+                result['test_rgb'],
+                result['rgb_difference'],
+                result['total_difference'],
+                status))
+
         # Technical Details
-        report_lines.append("TECHNICAL DETAILS:")
-        report_lines.append("-" * 40)
-        report_lines.append(f"Difference calculation: Euclidean distance in RGB space")
-        report_lines.append(f"Significance threshold: {self.significance_threshold} (differences >= {self.significance_threshold} are flagged)")
-        report_lines.append(f"Test point selection method: {getattr(self, '_last_method', 'unknown')}")
-        report_lines.append("")
-        
-        # Recommendations
-        report_lines.append("RECOMMENDATIONS:")
-        report_lines.append("-" * 40)
-        grade, description = self._calculate_quality_grade(pass_rate)
-        
+        emit("TECHNICAL DETAILS:")
+        emit("-" * 40)
+        emit(f"Difference calculation: Euclidean distance in RGB space")
+        emit(f"Significance threshold: {self.significance_threshold} (differences >= {self.significance_threshold} are flagged)")
+        emit(f"Test point selection method: {getattr(self, '_last_method', 'unknown')}")
+        emit()
+
+        # Recommendations (grade/description already computed above)
+        emit("RECOMMENDATIONS:")
+        emit("-" * 40)
+
         # Add quality indicator icon
         if grade == GRADE_EXCELLENT:
-            report_lines.append("✓ IMAGE QUALITY: EXCELLENT")
+            emit("✓ IMAGE QUALITY: EXCELLENT")
         elif grade == GRADE_GOOD:
-            report_lines.append("✓ IMAGE QUALITY: GOOD")
+            emit("✓ IMAGE QUALITY: GOOD")
         elif grade == GRADE_ACCEPTABLE:
-            report_lines.append("⚠ IMAGE QUALITY: ACCEPTABLE")
+            emit("⚠ IMAGE QUALITY: ACCEPTABLE")
         else:
-            report_lines.append("✗ IMAGE QUALITY: FAIL")
-            
-        report_lines.append(f"  {description}")
-        
+            emit("✗ IMAGE QUALITY: FAIL")
+
+        emit(f"  {description}")
+
         # Add specific recommendations based on grade
         if grade == GRADE_EXCELLENT:
-            report_lines.append("  Recommended action: Continue with current process.")
+            emit("  Recommended action: Continue with current process.")
         elif grade == GRADE_GOOD:
-            report_lines.append("  Recommended action: Monitor quality trends.")
+            emit("  Recommended action: Monitor quality trends.")
         elif grade == GRADE_ACCEPTABLE:
-            report_lines.append("  Recommended action: Investigate potential causes and implement improvements.")
+            emit("  Recommended action: Investigate potential causes and implement improvements.")
         else:
-            report_lines.append("  Recommended action: Review and correct the imaging process immediately.")
-            report_lines.append("  Significant pixel defects detected.")
-            report_lines.append("  Immediate investigation and correction required.")
-            report_lines.append("  Do not use for production without fixes.")
-        
-        report_text = "\n".join(report_lines)
-        
+            emit("  Recommended action: Review and correct the imaging process immediately.")
+            emit("  Significant pixel defects detected.")
+            emit("  Immediate investigation and correction required.")
+            emit("  Do not use for production without fixes.")
+
         if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(report_text)
+            # Binary write - the buffer is already UTF-8 encoded
+            with open(output_path, 'wb') as f:
+                f.write(buf)
             print(f"Report saved to: {output_path}")
-        
-        return report_text
+
+        return buf.decode('utf-8')
     
     def run_full_analysis(self, num_points: int = 8, method: str = 'random', 
                          custom_points: list = None, save_visualization: bool = True, 
@@ -507,48 +770,57 @@ class ImageComparisonTool:
             custom_points: List of (x,y) tuples for custom method
             save_visualization: Whether to save visualization chart
             save_report: Whether to save text report
+
+        Returns:
+            dict: Paths of the saved output files {'viz': ..., 'report': ...}
+                  (values are None for outputs that were not saved)
         """
         print("Starting Video Image Quality Analysis...")
         print("=" * 50)
         
         # Store method for reporting
         self._last_method = method
+
+        # Reset saved-output tracking for this run
+        self.output_paths = {'viz': None, 'report': None}
         
         # Step 1: Load images
         if not self.load_images():
             print("❌ Analysis failed: Could not load images")
-            return
-        
+            return self.output_paths
+
         # Step 2: Generate test points
         self.generate_test_points(num_points, method, custom_points)
         if not self.test_points:
             print("❌ Analysis failed: Could not generate test points")
-            return
-        
+            return self.output_paths
+
         # Step 3: Compare pixels
         self.compare_pixels()
         if not self.comparison_results:
             print("❌ Analysis failed: Could not compare pixels")
-            return
+            return self.output_paths
         
         # Step 4: Generate outputs
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
+
         # Create organized directory structure
         session_folder = f"reports/analysis_{timestamp}_{method}"
         os.makedirs(session_folder, exist_ok=True)
-        
-        # Create visualization
+
+        # Create visualization - only when the caller wants it saved;
+        # rendering a figure just to discard it is the single most
+        # expensive step in headless/batch runs
         if save_visualization:
             vis_path = f"{session_folder}/comparison_visualization_{timestamp}.png"
             self.visualize_comparison(vis_path)
-        else:
-            self.visualize_comparison()
-        
+            self.output_paths['viz'] = vis_path
+
         # Generate text report
         if save_report:
             report_path = f"{session_folder}/comparison_report_{timestamp}.txt"
             self.generate_report(report_path)
+            self.output_paths['report'] = report_path
         
         # Print summary
         significant_count = sum(1 for r in self.comparison_results if r['is_significant'])
@@ -575,6 +847,8 @@ class ImageComparisonTool:
         if save_visualization or save_report:
             print(f"\n📁 Files saved in '{session_folder}/' directory")
 
+        return self.output_paths
+
 
 if __name__ == "__main__":
     # Example usage
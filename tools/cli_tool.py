@@ -10,38 +10,42 @@ Usage examples:
 """
 
 import argparse
+import re
 import sys
 import os
 
 # Add src directory to path for imports
+# (ImageComparisonTool itself is imported lazily inside main() so that
+# --help and argument/path validation errors don't pay for the heavy
+# NumPy/OpenCV/matplotlib import chain)
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-from image_comparison_tool import ImageComparisonTool
 
 
-def parse_custom_points(point_strings):
+# Compiled once - argparse calls _xy per token, so the regex pass is
+# the only per-point work and argparse handles the error reporting
+_XY_RE = re.compile(r'^(-?\d+),(-?\d+)$')
+
+
+def _xy(point_str):
     """
-    Parse custom point coordinates from command line
-    
+    argparse type= callable parsing a single "x,y" coordinate token
+
     Args:
-        point_strings: List of strings in format "x,y"
-        
+        point_str: String in format "x,y"
+
     Returns:
-        List of (x,y) tuples
+        (x, y) tuple of ints
     """
-    points = []
-    for point_str in point_strings:
-        try:
-            x, y = map(int, point_str.split(','))
-            points.append((x, y))
-        except ValueError:
-            print(f"❌ Invalid point format: {point_str}. Use format: x,y")
-            sys.exit(1)
-    return points
+    match = _XY_RE.match(point_str)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid point format: {point_str}. Use format: x,y")
+    return (int(match[1]), int(match[2]))
 
 
-def main():
+def _build_parser():
     """
-    Main command line interface
+    Build the full argument parser (deferred so trivial invocations can
+    skip its construction cost entirely)
     """
     parser = argparse.ArgumentParser(
         description="Video Image Checker - Compare images for defects",
@@ -54,7 +58,7 @@ Examples:
   %(prog)s ref.jpg test.jpg --custom 100,100 200,200 300,300 400,400
         """
     )
-    
+
     # Required arguments
     parser.add_argument('reference', help='Path to reference (good) image')
     parser.add_argument('test', help='Path to test image to check')
@@ -68,7 +72,7 @@ Examples:
     parser.add_argument('--points', '-p', type=int, default=8,
                        help='Number of test points (must be 8 for assignment compliance, default: 8)')
     
-    parser.add_argument('--custom', nargs='+', metavar='X,Y',
+    parser.add_argument('--custom', nargs='+', type=_xy, metavar='X,Y',
                        help='Custom point coordinates (format: x,y x,y ...)')
     
     parser.add_argument('--no-save', action='store_true',
@@ -79,9 +83,24 @@ Examples:
     
     parser.add_argument('--threshold', '-t', type=float, default=30.0,
                        help='Significance threshold for defects (default: 30.0)')
-    
+
+    return parser
+
+
+def main():
+    """
+    Main command line interface
+    """
+    # Fast path: no arguments at all - fail with a short usage hint
+    # without paying for full parser construction
+    if len(sys.argv) == 1:
+        prog = os.path.basename(sys.argv[0])
+        print(f"usage: {prog} reference test [options]  (use --help for details)", file=sys.stderr)
+        sys.exit(2)
+
+    parser = _build_parser()
     args = parser.parse_args()
-    
+
     # Validate inputs
     if not os.path.exists(args.reference):
         print(f"❌ Reference image not found: {args.reference}")
@@ -91,13 +110,13 @@ Examples:
         print(f"❌ Test image not found: {args.test}")
         sys.exit(1)
     
-    # Handle custom points
+    # Handle custom points (already parsed into (x,y) tuples by argparse)
     custom_points = None
     if args.method == 'custom':
         if not args.custom:
             print("❌ Custom method requires --custom points")
             sys.exit(1)
-        custom_points = parse_custom_points(args.custom)
+        custom_points = args.custom
         args.points = len(custom_points)
     elif args.custom:
         print("⚠️  --custom specified but method is not 'custom', ignoring custom points")
@@ -120,6 +139,9 @@ Examples:
     
     # Create checker and run analysis
     try:
+        # Deferred import - only paid once arguments and paths are valid
+        from image_comparison_tool import ImageComparisonTool
+
         checker = ImageComparisonTool(args.reference, args.test)
         
         # Set custom threshold if specified
@@ -137,10 +159,10 @@ Examples:
         
         # Print results summary
         if not args.quiet and checker.comparison_results:
-            significant_count = sum(1 for r in checker.comparison_results 
-                                  if r['is_significant'])
-            pass_rate = ((len(checker.comparison_results) - significant_count) / 
-                        len(checker.comparison_results) * 100)
+            # SIMD-friendly boolean reduction on the columnar result arrays
+            flags = checker.results['is_significant']
+            significant_count = int(flags.sum())
+            pass_rate = ((len(flags) - significant_count) / len(flags) * 100)
             
             print("\n" + "=" * 50)
             print("📊 FINAL SUMMARY")
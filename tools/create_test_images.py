@@ -20,24 +20,20 @@ def create_test_images_with_defects():
     
     # Create reference image
     width, height = 800, 600
-    reference = Image.new('RGB', (width, height), (50, 100, 150))  # Blue-gray background
-    
+
+    # Solid color sections as NumPy slice fills (vectorized stores
+    # instead of per-rectangle ImageDraw calls)
+    arr = np.empty((height, width, 3), dtype=np.uint8)
+    arr[:] = (50, 100, 150)                  # Blue-gray background
+    arr[0:150, :] = (100, 150, 200)          # Top section - light blue
+    arr[150:, 0:200] = (50, 180, 80)         # Left section - green
+    arr[150:, 600:] = (200, 60, 70)          # Right section - red
+    arr[200:400, 200:600] = (220, 200, 50)   # Center section - yellow
+
+    reference = Image.fromarray(arr)
+
+    # Add some geometric shapes (the ellipse still needs PIL's rasterizer)
     draw_ref = ImageDraw.Draw(reference)
-    
-    # Add colored sections to reference image
-    # Top section - light blue
-    draw_ref.rectangle([0, 0, width, 150], fill=(100, 150, 200))
-    
-    # Left section - green
-    draw_ref.rectangle([0, 150, 200, height], fill=(50, 180, 80))
-    
-    # Right section - red
-    draw_ref.rectangle([600, 150, width, height], fill=(200, 60, 70))
-    
-    # Center section - yellow
-    draw_ref.rectangle([200, 200, 600, 400], fill=(220, 200, 50))
-    
-    # Add some geometric shapes
     draw_ref.ellipse([300, 250, 500, 350], fill=(150, 100, 250))  # Purple circle
     
     reference.save('images/ref_02.jpg')
@@ -61,25 +57,27 @@ def create_test_images_with_defects():
     print("  Added: Minor defects - subtle color shifts")
     
     # Type 4: Noise/corruption in specific areas
-    pixels = test.load()
-    
-    # Add noise in top-left corner
-    for x in range(50, 100):
-        for y in range(100, 130):
-            if (x + y) % 3 == 0:  # Add noise every 3rd pixel
-                r, g, b = pixels[x, y]
-                pixels[x, y] = (
-                    min(255, max(0, r + 60)),  # Significant red increase
-                    min(255, max(0, g - 40)),  # Green decrease
-                    b  # Keep blue the same
-                )
+    # Vectorized via NumPy instead of per-pixel PIL access
+    arr = np.array(test)
+
+    # Add noise in top-left corner (every 3rd pixel)
+    xx = np.arange(50, 100)
+    yy = np.arange(100, 130)[:, None]
+    noise_mask = ((xx + yy) % 3) == 0
+
+    region = arr[100:130, 50:100].astype(np.int16)
+    region[..., 0] += 60  # Significant red increase
+    region[..., 1] -= 40  # Green decrease (blue stays the same)
+    region = np.clip(region, 0, 255).astype(np.uint8)
+    arr[100:130, 50:100][noise_mask] = region[noise_mask]
+
+    test = Image.fromarray(arr)
     print("  Added: Noise pattern in corner")
-    
+
     # Type 5: Line defects (simulate screen lines)
-    for x in range(300, 500):
-        y = 180
-        pixels[x, y] = (255, 0, 255)  # Bright magenta line
-        pixels[x, y + 1] = (255, 0, 255)
+    # Single C-level draw call instead of 400 per-pixel writes
+    draw_test = ImageDraw.Draw(test)
+    draw_test.line([(300, 180), (499, 180)], fill=(255, 0, 255), width=2)
     print("  Added: Line defect")
     
     test.save('images/test_02.jpg')
@@ -94,34 +92,23 @@ def create_gradient_test_images():
     print("\nCreating gradient test images...")
     
     width, height = 400, 300
-    
+
+    # Build RGB gradient channels with NumPy broadcasting instead of
+    # per-pixel Python loops (120k iterations per image otherwise)
+    xs = np.arange(width, dtype=np.int32)
+    ys = np.arange(height, dtype=np.int32)[:, None]
+
+    r = np.broadcast_to(255 * xs // width, (height, width))
+    g = np.broadcast_to(255 * ys // height, (height, width))
+    b = 255 * (xs + ys) // (width + height)
+
     # Reference - smooth gradient
-    reference = Image.new('RGB', (width, height))
-    pixels_ref = reference.load()
-    
-    for y in range(height):
-        for x in range(width):
-            # Create RGB gradients
-            r = int(255 * x / width)
-            g = int(255 * y / height) 
-            b = int(255 * (x + y) / (width + height))
-            pixels_ref[x, y] = (r, g, b)
-    
-    reference.save('images/ref_03.jpg')
-    
-    # Test - gradient with steps/banding
-    test = Image.new('RGB', (width, height))
-    pixels_test = test.load()
-    
-    for y in range(height):
-        for x in range(width):
-            # Create stepped gradients (quantization artifacts)
-            r = int((255 * x / width) // 32) * 32  # Quantize to 32-level steps
-            g = int((255 * y / height) // 32) * 32
-            b = int((255 * (x + y) / (width + height)) // 32) * 32
-            pixels_test[x, y] = (r, g, b)
-    
-    test.save('images/test_03.jpg')
+    reference_arr = np.dstack([r, g, b]).astype(np.uint8)
+    Image.fromarray(reference_arr).save('images/ref_03.jpg')
+
+    # Test - gradient with steps/banding (quantize to 32-level steps)
+    test_arr = np.dstack([r // 32 * 32, g // 32 * 32, b // 32 * 32]).astype(np.uint8)
+    Image.fromarray(test_arr).save('images/test_03.jpg')
     print("✓ Gradient images created: ref_03.jpg & test_03.jpg")
     
     return 'images/ref_03.jpg', 'images/test_03.jpg'
@@ -6,16 +6,118 @@ Interactive demo script for video image testing system with user input
 """
 
 import numpy as np
-from PIL import Image, ImageDraw
-import matplotlib.pyplot as plt
+from PIL import Image
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 from image_comparison_tool import ImageComparisonTool
 
+# Accepted image extensions - a tuple so str.endswith takes CPython's
+# C-level multi-suffix fast path
+_VALID_EXTS = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff')
+
+# Compiled once - coordinate validation happens in the regex engine
+# instead of int() raising (and paying for) ValueError on bad input
+_COORD_RE = re.compile(r'^(\d+),(\d+)$')
+
+# One PCG64 generator for the module - construction isn't free and the
+# legacy global RandomState takes a slower per-call path
+_RNG = np.random.default_rng()
+
+# Fixed sample-image noise coordinates, built once so repeated sample
+# generation indexes the same array with no per-call allocation
+_NOISE_POINTS = np.array([(150, 150), (350, 200), (550, 250),
+                          (250, 400), (100, 450)], dtype=np.int32)
+
+# Stat results for paths already validated this session, so downstream
+# checks don't re-stat files the prompts just confirmed exist
+_path_cache = {}
+
+# Directories already ensured this session - even with exist_ok=True,
+# os.makedirs issues a mkdir syscall that fails with EEXIST every time
+_ensured_dirs = set()
+
+
+def _ensure_dir(directory):
+    """
+    os.makedirs(exist_ok=True) that hits the filesystem once per
+    directory per session
+
+    Args:
+        directory: Directory path to create if missing
+    """
+    if directory not in _ensured_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _ensured_dirs.add(directory)
+
+# In-memory RGB arrays for sample images generated this session - the
+# demo hands these straight to the checker, skipping the decode of the
+# JPEGs it just encoded
+_sample_arrays = {}
+
+
+def _make_checker(ref_path, test_path):
+    """
+    Build a checker for two paths, using in-memory sample arrays if the
+    images were generated this session
+
+    Args:
+        ref_path: Path to reference image
+        test_path: Path to test image
+
+    Returns:
+        ImageComparisonTool ready for analysis
+    """
+    ref_arr = _sample_arrays.get(ref_path)
+    test_arr = _sample_arrays.get(test_path)
+    if ref_arr is not None and test_arr is not None:
+        return ImageComparisonTool.from_arrays(ref_arr, test_arr,
+                                               reference_name=ref_path,
+                                               test_name=test_path)
+
+    # Overlap the two reads/decodes - PIL releases the GIL in its C
+    # decoders, so on slow or networked storage both images load in
+    # parallel instead of back to back
+    def _open(path):
+        img = Image.open(path)
+        img.load()  # Image.open is lazy; force the decode in the worker
+        return img
+
+    with ThreadPoolExecutor(2) as ex:
+        ref_future = ex.submit(_open, ref_path)
+        test_future = ex.submit(_open, test_path)
+        ref_img, test_img = ref_future.result(), test_future.result()
+
+    return ImageComparisonTool.from_images(ref_img, test_img,
+                                           reference_name=ref_path,
+                                           test_name=test_path)
+
+
+def _stat_cached(path):
+    """
+    os.stat through the session-level path cache
+
+    Args:
+        path: File path to stat
+
+    Returns:
+        os.stat_result if the file exists, None otherwise
+    """
+    key = os.path.abspath(path)
+    st = _path_cache.get(key)
+    if st is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        _path_cache[key] = st
+    return st
+
 
 def get_user_choice():
     """
@@ -67,27 +169,45 @@ def get_custom_points():
     print("Enter 8 pixel coordinates in format: x,y")
     print("Example: 100,150")
     print("(Note: Coordinates should be within image bounds)")
-    
+
+    # Scripted use (stdin piped from a file): read line by line without
+    # input()'s prompt/flush overhead, stopping as soon as 8 pairs are
+    # collected so the rest of the stream stays available for the
+    # prompts that follow
+    if not sys.stdin.isatty():
+        points = []
+        while len(points) < 8:
+            line = sys.stdin.readline()
+            if not line:
+                break
+            match = _COORD_RE.match(line.strip().replace(' ', ''))
+            if match:
+                points.append((int(match[1]), int(match[2])))
+        if len(points) == 8:
+            return points
+        print(f"❌ Expected 8 coordinate pairs on stdin, got {len(points)}")
+        exit(1)
+
     points = []
     for i in range(8):
         while True:
             try:
                 coord_str = input(f"Point {i+1} (x,y): ").strip()
-                x, y = map(int, coord_str.split(','))
-                
-                if x < 0 or y < 0:
-                    print("❌ Coordinates must be positive numbers")
+                match = _COORD_RE.match(coord_str.replace(' ', ''))
+
+                if not match:
+                    # Covers bad formats and negative values alike -
+                    # the pattern only admits non-negative "x,y"
+                    print("❌ Invalid format. Use: x,y (example: 100,150)")
                     continue
-                    
-                points.append((x, y))
+
+                points.append((int(match[1]), int(match[2])))
                 break
-                
-            except ValueError:
-                print("❌ Invalid format. Use: x,y (example: 100,150)")
+
             except KeyboardInterrupt:
                 print("\n\n👋 Goodbye!")
                 exit()
-    
+
     return points
 
 
@@ -138,13 +258,16 @@ def get_image_paths():
                 # Create or use existing sample images
                 ref_path = "images/ref_01.jpg"
                 test_path = "images/test_image.jpg"
-                
-                if os.path.exists(ref_path) and os.path.exists(test_path):
-                    print("✅ Using existing sample images")
-                    return ref_path, test_path
-                else:
+
+                # Cached stat calls - a missing file falls straight
+                # through to regeneration, and repeat visits don't
+                # re-stat files already confirmed this session
+                if _stat_cached(ref_path) is None or _stat_cached(test_path) is None:
                     print("Creating new sample images...")
                     return create_sample_images()
+
+                print("✅ Using existing sample images")
+                return ref_path, test_path
                     
             elif choice == '2':
                 # Get custom file paths
@@ -180,14 +303,13 @@ def get_custom_image_paths():
                 print("❌ Reference path cannot be empty")
                 continue
                 
-            if not os.path.exists(ref_path):
+            if _stat_cached(ref_path) is None:
                 print(f"❌ File not found: {ref_path}")
                 continue
                 
             # Check if it's an image file
-            valid_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']
-            if not any(ref_path.lower().endswith(ext) for ext in valid_extensions):
-                print(f"❌ Invalid image format. Supported: {', '.join(valid_extensions)}")
+            if not ref_path.lower().endswith(_VALID_EXTS):
+                print(f"❌ Invalid image format. Supported: {', '.join(_VALID_EXTS)}")
                 continue
                 
             break
@@ -203,13 +325,13 @@ def get_custom_image_paths():
                 print("❌ Test path cannot be empty")
                 continue
                 
-            if not os.path.exists(test_path):
+            if _stat_cached(test_path) is None:
                 print(f"❌ File not found: {test_path}")
                 continue
                 
             # Check if it's an image file
-            if not any(test_path.lower().endswith(ext) for ext in valid_extensions):
-                print(f"❌ Invalid image format. Supported: {', '.join(valid_extensions)}")
+            if not test_path.lower().endswith(_VALID_EXTS):
+                print(f"❌ Invalid image format. Supported: {', '.join(_VALID_EXTS)}")
                 continue
                 
             break
@@ -242,24 +364,24 @@ def browse_images_folder():
         print("Please add your images to the images/ folder and try again.")
         return get_image_paths()
     
-    # Get all image files in images folder
-    valid_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']
-    image_files = []
-    
-    for file in os.listdir(images_dir):
-        if any(file.lower().endswith(ext) for ext in valid_extensions):
-            image_files.append(file)
-    
-    if not image_files:
+    # Get all image files in one scandir pass - each DirEntry carries
+    # cached stat info, so listing sizes doesn't cost a second stat
+    # syscall per file
+    with os.scandir(images_dir) as it:
+        entries = [e for e in it
+                   if e.is_file() and e.name.lower().endswith(_VALID_EXTS)]
+
+    if not entries:
         print("❌ No image files found in images/ folder.")
         print("Please add your images and try again.")
         return get_image_paths()
-    
+
+    image_files = [e.name for e in entries]
     print(f"Found {len(image_files)} image file(s):")
-    for i, file in enumerate(image_files, 1):
-        file_path = os.path.join(images_dir, file)
-        file_size = os.path.getsize(file_path)
-        print(f"{i:2d}. {file} ({file_size // 1024} KB)")
+    for i, entry in enumerate(entries, 1):
+        st = entry.stat()
+        _path_cache[os.path.abspath(entry.path)] = st
+        print(f"{i:2d}. {entry.name} ({st.st_size // 1024} KB)")
     
     # Select reference image
     while True:
@@ -311,55 +433,76 @@ def create_sample_images():
     Returns:
         tuple: Paths to reference and test images
     """
+    ref_out, test_out = 'images/ref_01.jpg', 'images/test_01.jpg'
+
+    # Outputs already on disk - skip the whole draw + JPEG encode path
+    if os.path.exists(ref_out) and os.path.exists(test_out):
+        print("✅ Sample images already exist - reusing them")
+        return ref_out, test_out
+
     print("Creating sample images for demonstration...")
-    
+
     # Create reference image
     width, height = 800, 600
-    reference = Image.new('RGB', (width, height), (100, 150, 200))
-    
-    # Add shapes to reference image
-    draw = ImageDraw.Draw(reference)
-    
-    # Colored rectangles
-    draw.rectangle([100, 100, 200, 200], fill=(255, 0, 0))    # Red
-    draw.rectangle([300, 150, 400, 250], fill=(0, 255, 0))    # Green
-    draw.rectangle([500, 200, 600, 300], fill=(0, 0, 255))    # Blue
-    draw.rectangle([200, 350, 350, 450], fill=(255, 255, 0))  # Yellow
-    
-    # Circles
-    draw.ellipse([50, 400, 150, 500], fill=(255, 0, 255))     # Magenta
-    draw.ellipse([600, 100, 700, 200], fill=(0, 255, 255))    # Cyan
-    
-    reference.save('images/ref_01.jpg')
-    
-    # Create test image with defects
-    test = reference.copy()
-    draw_test = ImageDraw.Draw(test)
-    
-    # Add "defects" - corrupted pixels
-    draw_test.rectangle([120, 120, 140, 140], fill=(0, 0, 0))      # Black hole
-    draw_test.rectangle([320, 170, 340, 190], fill=(255, 255, 255)) # White spot
-    draw_test.rectangle([520, 220, 540, 240], fill=(128, 128, 128)) # Gray spot
-    
-    # Add noise at specific points
-    pixels = test.load()
-    noise_points = [(150, 150), (350, 200), (550, 250), (250, 400), (100, 450)]
-    
-    for x, y in noise_points:
-        # Add random noise
-        r, g, b = pixels[x, y]
-        pixels[x, y] = (
-            min(255, max(0, r + np.random.randint(-50, 51))),
-            min(255, max(0, g + np.random.randint(-50, 51))),
-            min(255, max(0, b + np.random.randint(-50, 51)))
-        )
-    
-    test.save('images/test_01.jpg')
+
+    # Colored rectangles as NumPy slice fills and both circles from one
+    # precomputed disc mask - vectorized stores instead of per-shape
+    # ImageDraw rasterizer calls (bounds inclusive, matching ImageDraw)
+    arr = np.empty((height, width, 3), dtype=np.uint8)
+    arr[:] = (100, 150, 200)                 # Blue-gray background
+    arr[100:201, 100:201] = (255, 0, 0)      # Red
+    arr[150:251, 300:401] = (0, 255, 0)      # Green
+    arr[200:301, 500:601] = (0, 0, 255)      # Blue
+    arr[350:451, 200:351] = (255, 255, 0)    # Yellow
+
+    # Both circles are radius-50 discs, so a single 101x101 boolean
+    # mask covers them
+    span = np.arange(101) - 50
+    disc = (span[:, None] ** 2 + span[None, :] ** 2) <= 50 ** 2
+    arr[400:501, 50:151][disc] = (255, 0, 255)   # Magenta
+    arr[100:201, 600:701][disc] = (0, 255, 255)  # Cyan
+
+    reference = Image.fromarray(arr)
+
+    # PIL releases the GIL during the C-level JPEG encode, so the
+    # reference encode runs in the background while the test image is
+    # still being built, and both writes overlap
+    with ThreadPoolExecutor(2) as ex:
+        # Fast single-pass encode - these are throwaway demo JPEGs, so
+        # skip the optimizer's extra Huffman pass, keep 4:2:0 subsampling
+        ref_save = ex.submit(reference.save, ref_out, 'JPEG',
+                             quality=80, optimize=False, subsampling=2)
+
+        # Create test image with defects - one memcpy of the reference
+        # array plus three slice stores, no second ImageDraw pass
+        test_arr = arr.copy()
+        test_arr[120:141, 120:141] = (0, 0, 0)        # Black hole
+        test_arr[170:191, 320:341] = (255, 255, 255)  # White spot
+        test_arr[220:241, 520:541] = (128, 128, 128)  # Gray spot
+
+        # Add noise at the fixed _NOISE_POINTS coordinates - one batched
+        # RNG draw for all points, applied with fancy indexing and a
+        # branchless np.clip clamp instead of per-pixel PyAccess writes
+        noise = _RNG.integers(-50, 51, size=(len(_NOISE_POINTS), 3), dtype=np.int16)
+        xs, ys = _NOISE_POINTS[:, 0], _NOISE_POINTS[:, 1]
+        test_arr[ys, xs] = np.clip(test_arr[ys, xs].astype(np.int16) + noise, 0, 255).astype(np.uint8)
+        test = Image.fromarray(test_arr)
+
+        test_save = ex.submit(test.save, test_out, 'JPEG',
+                              quality=80, optimize=False, subsampling=2)
+        ref_save.result()
+        test_save.result()
+
+    # Keep the freshly built arrays so this run's analysis can skip
+    # re-decoding the JPEGs that were just encoded
+    _sample_arrays[ref_out] = arr
+    _sample_arrays[test_out] = test_arr
+
     print("✅ Sample images created successfully!")
-    print(f"   📁 Reference: images/ref_01.jpg ({width}x{height})")
-    print(f"   📁 Test: images/test_01.jpg ({width}x{height})")
-    
-    return 'images/ref_01.jpg', 'images/test_01.jpg'
+    print(f"   📁 Reference: {ref_out} ({width}x{height})")
+    print(f"   📁 Test: {test_out} ({width}x{height})")
+
+    return ref_out, test_out
 
 
 def run_interactive_demo():
@@ -370,9 +513,9 @@ def run_interactive_demo():
     print("🎥 VIDEO IMAGE CHECKER - INTERACTIVE MODE")
     print("=" * 70)
     
-    # Create directories if they don't exist
-    os.makedirs('images', exist_ok=True)
-    os.makedirs('reports', exist_ok=True)
+    # Create directories if they don't exist (memoized per session)
+    _ensure_dir('images')
+    _ensure_dir('reports')
     
     # Get image paths from user
     ref_path, test_path = get_image_paths()
@@ -398,8 +541,8 @@ def run_interactive_demo():
     print("\n🔍 STARTING ANALYSIS...")
     print("=" * 30)
     
-    checker = ImageComparisonTool(ref_path, test_path)
-    
+    checker = _make_checker(ref_path, test_path)
+
     if method == 'all':
         # Run all methods
         methods = ['strategic', 'grid', 'random']
@@ -431,10 +574,12 @@ def run_interactive_demo():
             report_path = f"reports/custom_report_{timestamp}.txt"
             checker.generate_report(report_path)
         
-        # Print summary
-        significant_count = sum(1 for r in checker.comparison_results if r['is_significant'])
-        pass_rate = ((len(checker.comparison_results) - significant_count) / 
-                    len(checker.comparison_results) * 100)
+        # Print summary - SIMD-friendly reduction over the columnar
+        # result flags, with the length taken once
+        flags = checker.results['is_significant']
+        total = len(flags)
+        significant_count = int(flags.sum())
+        pass_rate = (total - significant_count) / total * 100 if total else 0.0
         
         print(f"\n✅ Custom analysis completed!")
         print(f"📊 Pass rate: {pass_rate:.1f}%")